@@ -6,6 +6,7 @@
 
 # -- Path setup --------------------------------------------------------------
 
+import functools
 import inspect
 import os
 import subprocess
@@ -25,27 +26,32 @@ GH_PROJECT = "tabula-py"
 MODULE = "tabula"
 
 
-def linkcode_resolve(domain, info):
-    """Generate link to GitHub.
-    References:
-    - https://github.com/scikit-learn/scikit-learn/blob/f0faaee45762d0a5c75dcf3d487c118b10e1a5a8/doc/conf.py
-    - https://github.com/chainer/chainer/pull/2758/
-    """
-    if domain != "py" or not info["module"]:
-        return None
-
-    # tag
+def _get_revision():
     try:
         revision = subprocess.check_output(["git", "rev-parse", "HEAD"]).strip()
     except (subprocess.CalledProcessError, OSError):
         print("Failed to execute git to get revision")
         return None
-    revision = revision.decode("utf-8")
+    return revision.decode("utf-8")
+
+
+# The revision is invariant during a build, so compute it only once.
+# Local builds link to the default branch so that the generated pages stay
+# the same across commits.
+if os.environ.get("READTHEDOCS") or os.environ.get("CI"):
+    _GIT_REVISION = _get_revision()
+else:
+    _GIT_REVISION = "master"
+_PKG_ROOT_DIR = os.path.dirname(__import__(MODULE).__file__)
 
-    obj = sys.modules.get(info["module"])
+
+@functools.lru_cache(maxsize=None)
+def _resolve(module, fullname):
+    """Resolve relative path and line number of a documented object."""
+    obj = sys.modules.get(module)
     if obj is None:
         return None
-    for comp in info["fullname"].split("."):
+    for comp in fullname.split("."):
         obj = getattr(obj, comp)
 
     # filename
@@ -57,11 +63,10 @@ def linkcode_resolve(domain, info):
         return None
 
     # relpath
-    pkg_root_dir = os.path.dirname(__import__(MODULE).__file__)
-    filename = os.path.realpath(filename)
-    if not filename.startswith(pkg_root_dir):
+    filename = _realpath(filename)
+    if not filename.startswith(_PKG_ROOT_DIR):
         return None
-    relpath = os.path.relpath(filename, pkg_root_dir)
+    relpath = os.path.relpath(filename, _PKG_ROOT_DIR)
 
     # line number
     try:
@@ -69,8 +74,37 @@ def linkcode_resolve(domain, info):
     except Exception:
         linenum = ""
 
-    return "https://github.com/{}/{}/blob/{}/{}/{}#L{}".format(
-        GH_ORGANIZATION, GH_PROJECT, revision, MODULE, relpath, linenum
+    return relpath, linenum
+
+
+@functools.lru_cache(maxsize=None)
+def _realpath(filename):
+    # Re-exported objects in tabula/__init__.py share the same source files
+    return os.path.realpath(filename)
+
+
+def linkcode_resolve(domain, info):
+    """Generate link to GitHub.
+    References:
+    - https://github.com/scikit-learn/scikit-learn/blob/f0faaee45762d0a5c75dcf3d487c118b10e1a5a8/doc/conf.py
+    - https://github.com/chainer/chainer/pull/2758/
+    """
+    if domain != "py" or not info["module"]:
+        return None
+
+    # tag
+    revision = _GIT_REVISION
+    if revision is None:
+        return None
+
+    resolved = _resolve(info["module"], info["fullname"])
+    if resolved is None:
+        return None
+    relpath, linenum = resolved
+
+    return (
+        f"https://github.com/{GH_ORGANIZATION}/{GH_PROJECT}/blob/{revision}/"
+        f"{MODULE}/{relpath}#L{linenum}"
     )
 
 
@@ -115,6 +149,10 @@ html_theme = "sphinx_rtd_theme"
 # html_static_path = ["_static"]
 html_static_path = []
 
+# Don't copy reST sources into the output, which is only needed for
+# "View page source" links.
+html_copy_source = False
+
 # Work around for contents.rst not found error
 # See also: https://github.com/readthedocs/readthedocs.org/issues/2569
 master_doc = "index"
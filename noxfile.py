@@ -1,7 +1,14 @@
+"""nox sessions for linting and testing tabula-py.
+
+Run ``nox`` to execute all sessions sequentially. To run the test matrix
+concurrently, use ``python scripts/run_nox_parallel.py``, which launches one
+``nox -s <session>`` process per session and writes logs under ``.nox/logs``.
+"""
+
 import nox
 
 
-@nox.session
+@nox.session(reuse_venv=True)
 def lint(session):
     lint_tools = [
         "ruff",
@@ -9,14 +16,14 @@ def lint(session):
         "types-setuptools",
         "Flake8-pyproject",
     ]
-    targets = ["tabula", "tests", "noxfile.py"]
+    targets = ["tabula", "tests", "scripts", "noxfile.py"]
     session.install(*lint_tools)
     session.run("ruff", "format", "--check", *targets)
     session.run("ruff", "check", *targets)
     session.run("mypy", *targets)
 
 
-@nox.session
+@nox.session(reuse_venv=True)
 @nox.parametrize(
     "python,jpype",
     [
@@ -37,11 +44,20 @@ def tests(session, jpype):
 
 def tests_without_jpype(session):
     session.install(".[test]")
-    session.run("pytest", "-v", "tests/test_read_pdf_table.py")
+    session.run("pytest", *_xdist_args(session), "-v", "tests/test_read_pdf_table.py")
 
 
 def tests_with_jpype(session):
     session.install(".[jpype,test]")
-    session.run("pytest", "-v", "tests/test_read_pdf_table.py")
+    session.run("pytest", *_xdist_args(session), "-v", "tests/test_read_pdf_table.py")
+    # These tests depend on the JVM state of a fresh process, so they must not
+    # share a worker with the other tests.
     session.run("pytest", "-v", "tests/test_read_pdf_jar_path.py")
     session.run("pytest", "-v", "tests/test_read_pdf_silent.py")
+
+
+def _xdist_args(session):
+    # Respect user-provided pytest arguments like `nox -- -n 2`
+    if session.posargs:
+        return session.posargs
+    return ["-n", "auto"]
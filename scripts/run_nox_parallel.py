@@ -0,0 +1,56 @@
+"""Run nox sessions concurrently.
+
+Each session is launched as its own ``nox -s <session>`` process and its output
+is written into ``.nox/logs/<session>.log``.
+
+Usage:
+
+    python scripts/run_nox_parallel.py [session ...]
+"""
+
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+LOG_DIR = os.path.join(".nox", "logs")
+
+
+def list_sessions() -> List[str]:
+    output = subprocess.check_output(["nox", "--list", "--json"])
+    return [s["session"] for s in json.loads(output)]
+
+
+def run_session(session: str) -> Tuple[str, int]:
+    log_path = os.path.join(LOG_DIR, f"{session}.log")
+    with open(log_path, "w") as f:
+        proc = subprocess.run(
+            ["nox", "-s", session], stdout=f, stderr=subprocess.STDOUT
+        )
+    return session, proc.returncode
+
+
+def main(argv: List[str]) -> int:
+    sessions = argv or list_sessions()
+    os.makedirs(LOG_DIR, exist_ok=True)
+    # Leave some headroom for JVMs spawned by each session
+    max_workers = max(1, min(len(sessions), (os.cpu_count() or 1) - 2))
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for session, returncode in executor.map(run_session, sessions):
+            status = "success" if returncode == 0 else "failed"
+            print(f"{session}: {status}")
+            if returncode != 0:
+                failed.append(session)
+
+    if failed:
+        print(f"Failed sessions: {', '.join(failed)}. See logs under {LOG_DIR}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
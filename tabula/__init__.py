@@ -1,10 +1,49 @@
-from importlib.metadata import PackageNotFoundError, version
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-from .io import convert_into, convert_into_by_batch, read_pdf, read_pdf_with_template  # noqa: F401
-from .util import environment_info  # noqa: F401
+if TYPE_CHECKING:
+    from .io import (  # noqa: F401
+        convert_into,
+        convert_into_by_batch,
+        read_pdf,
+        read_pdf_with_template,
+    )
+    from .util import environment_info  # noqa: F401
 
-try:
-    __version__ = version("tabula-py")
-except PackageNotFoundError:
-    # package is not installed
-    pass
+# Public names are imported on first access to avoid importing pandas and
+# jpype when they aren't used.
+_LAZY_ATTRIBUTES = {
+    "convert_into": ".io",
+    "convert_into_by_batch": ".io",
+    "read_pdf": ".io",
+    "read_pdf_with_template": ".io",
+    "environment_info": ".util",
+}
+_SUBMODULES = {"backend", "errors", "file_util", "io", "template", "util"}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    if name in _SUBMODULES:
+        return import_module(f".{name}", __name__)
+    # Resolve the version lazily since importlib.metadata scans sys.path
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            __version__ = version("tabula-py")
+        except PackageNotFoundError:
+            # package is not installed
+            __version__ = "unknown"
+        globals()["__version__"] = __version__
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | _SUBMODULES)
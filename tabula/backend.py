@@ -1,7 +1,11 @@
+import errno
+import functools
+import mmap
 import os
 import subprocess
+import tempfile
 from logging import getLogger
-from typing import List, Optional
+from typing import IO, Any, Dict, List, Optional
 
 from .errors import JavaNotFoundError
 from .util import TabulaOption
@@ -17,13 +21,36 @@ JAR_NAME = f"tabula-{TABULA_JAVA_VERSION}-jar-with-dependencies.jar"
 JAR_DIR = os.path.abspath(os.path.dirname(__file__))
 DEFAULT_CONFIG = {"JAR_PATH": os.path.join(JAR_DIR, JAR_NAME)}
 
+# Java side handles shared by TabulaVm instances once the JVM has started
+_JVM_STATE: Dict[str, Any] = {}
+
 
 def jar_path() -> str:
-    return os.environ.get("TABULA_JAR", DEFAULT_CONFIG["JAR_PATH"])
+    path = os.environ.get("TABULA_JAR", DEFAULT_CONFIG["JAR_PATH"])
+    _validate_jar_path(path)
+    return path
+
+
+@functools.lru_cache(maxsize=None)
+def _validate_jar_path(path: str) -> None:
+    # Fail early rather than with "Unable to access jarfile" from java.
+    # Only successful checks are cached.
+    if not os.path.isfile(path):
+        raise FileNotFoundError(
+            errno.ENOENT,
+            "tabula-java JAR file is not found. Check TABULA_JAR environment variable",
+            path,
+        )
 
 
 class TabulaVm:
     def __init__(self, java_options: List[str], silent: Optional[bool]) -> None:
+        if _JVM_STATE:
+            self.tabula = _JVM_STATE["tabula"]
+            self.parser_class = _JVM_STATE["parser_class"]
+            self.lang = _JVM_STATE["lang"]
+            return
+
         try:
             import jpype
             import jpype.imports
@@ -42,6 +69,12 @@ class TabulaVm:
                         )
                     )
 
+                # The JVM lives as long as the Python process, so its heap is
+                # fixed at -Xmx to avoid full GCs for resizing it.
+                _xmx = [opt for opt in java_options if opt.startswith("-Xmx")]
+                if _xmx and not any(opt.startswith("-Xms") for opt in java_options):
+                    java_options.append("-Xms" + _xmx[-1][len("-Xmx") :])
+
                 jpype.startJVM(*java_options, convertStrings=False)
 
             import java.lang as lang
@@ -49,8 +82,11 @@ class TabulaVm:
             from org.apache.commons.cli import DefaultParser
 
             self.tabula = tabula
-            self.parser = DefaultParser()
+            self.parser_class = DefaultParser
             self.lang = lang
+            _JVM_STATE.update(
+                tabula=self.tabula, parser_class=self.parser_class, lang=self.lang
+            )
 
         except (ModuleNotFoundError, ImportError) as e:
             logger.warning(
@@ -58,7 +94,7 @@ class TabulaVm:
             )
             logger.warning(e)
             self.tabula = None
-            self.parse = None
+            self.parser_class = None
             self.lang = None
 
     def call_tabula_java(
@@ -69,7 +105,10 @@ class TabulaVm:
         if path:
             args.insert(0, path)
 
-        cmd = self.parser.parse(self.tabula.CommandLineApp.buildOptions(), args)
+        # DefaultParser keeps state while parsing, so it isn't shared between
+        # threads extracting concurrently.
+        parser = self.parser_class()
+        cmd = parser.parse(self.tabula.CommandLineApp.buildOptions(), args)
         self.tabula.CommandLineApp(sb, cmd).extractTables(cmd)
         return str(sb.toString())
 
@@ -78,27 +117,23 @@ class SubprocessTabula:
     def __init__(
         self, java_options: List[str], silent: Optional[bool], encoding: str
     ) -> None:
-        # Workaround to enforce the silent option. See:
-        # https://github.com/tabulapdf/tabula-java/issues/231#issuecomment-397281157
-        if silent:
-            java_options.extend(
-                (
-                    "-Dorg.slf4j.simpleLogger.defaultLogLevel=off",
-                    "-Dorg.apache.commons.logging.Log"
-                    "=org.apache.commons.logging.impl.NoOpLog",
-                )
-            )
-
-        self.java_options = java_options
+        self.java_options = self._build_java_options(java_options, silent)
         self.encoding = encoding
 
     def update_encoding(
         self, encoding: str, java_options: List[str], silent: Optional[bool]
     ) -> None:
         self.encoding = encoding
-        self.java_options = java_options
+        self.java_options = self._build_java_options(java_options, silent)
+
+    @staticmethod
+    def _build_java_options(
+        java_options: List[str], silent: Optional[bool]
+    ) -> List[str]:
+        # Workaround to enforce the silent option. See:
+        # https://github.com/tabulapdf/tabula-java/issues/231#issuecomment-397281157
         if silent:
-            self.java_options.extend(
+            java_options.extend(
                 (
                     "-Dorg.slf4j.simpleLogger.defaultLogLevel=off",
                     "-Dorg.apache.commons.logging.Log"
@@ -106,31 +141,54 @@ class SubprocessTabula:
                 )
             )
 
+        # Each process extracts tables only once, so the serial GC is enough
+        # and starts faster than the default GC on multi-core machines.
+        if not any(
+            opt.startswith("-XX:+Use") and opt.endswith("GC") for opt in java_options
+        ):
+            java_options.append("-XX:+UseSerialGC")
+
+        return java_options
+
     def call_tabula_java(
         self, options: TabulaOption, path: Optional[str] = None
     ) -> str:
-        args = (
-            ["java"]
-            + self.java_options
-            + ["-jar", jar_path()]
-            + options.build_option_list()
-        )
+        args = ["java", *self.java_options, "-jar", jar_path()]
+        args += options.build_option_list()
         if path:
             args.append(path)
 
         try:
-            result = subprocess.run(
-                args,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                stdin=subprocess.DEVNULL,
-                check=True,
-            )
-            if result.stderr:
-                logger.warning(f"Got stderr: {result.stderr.decode(self.encoding)}")
-            return result.stdout.decode(self.encoding)
+            # Write stdout into a temporary file rather than a pipe so that
+            # large outputs aren't accumulated in chunks by subprocess
+            with tempfile.TemporaryFile() as stdout:
+                result = subprocess.run(
+                    args,
+                    stdout=stdout,
+                    stderr=subprocess.PIPE,
+                    stdin=subprocess.DEVNULL,
+                    check=True,
+                    encoding=self.encoding,
+                )
+                if result.stderr:
+                    logger.warning(f"Got stderr: {result.stderr}")
+                return _decode_file(stdout, self.encoding)
         except FileNotFoundError:
             raise JavaNotFoundError(JAVA_NOT_FOUND_ERROR)
         except subprocess.CalledProcessError as e:
-            logger.error(f"Error from tabula-java:\n{e.stderr.decode(self.encoding)}\n")
+            logger.error(f"Error from tabula-java:\n{e.stderr}\n")
             raise
+
+
+def _decode_file(f: IO[bytes], encoding: str) -> str:
+    """Decode the whole content of a file.
+
+    The file is mapped into memory and decoded from there, so that its content
+    isn't also copied into a bytes object before decoding.
+    """
+    if os.fstat(f.fileno()).st_size == 0:
+        # Empty files can't be mapped
+        return ""
+
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return str(mm, encoding)
@@ -1,17 +1,34 @@
 from typing import Any
 
-from pandas.errors import ParserError
-
-
-class CSVParseError(ParserError):  # type: ignore
-    """Error represents CSV parse error, which mainly caused by pandas."""
-
-    def __init__(self, message: Any, cause: Any) -> None:
-        super(CSVParseError, self).__init__(message + ", caused by " + repr(cause))
-        self.cause = cause
+__all__ = ["CSVParseError", "JavaNotFoundError"]
 
 
 class JavaNotFoundError(Exception):
     """Error represents Java doesn't exist."""
 
     pass
+
+
+def __getattr__(name: str) -> Any:
+    # CSVParseError derives from pandas' ParserError. It's defined on first
+    # access so that importing this module doesn't import pandas.
+    if name == "CSVParseError":
+        from pandas.errors import ParserError
+
+        class CSVParseError(ParserError):  # type: ignore
+            """Error represents CSV parse error, which mainly caused by pandas."""
+
+            def __init__(self, message: Any, cause: Any) -> None:
+                super(CSVParseError, self).__init__(
+                    message + ", caused by " + repr(cause)
+                )
+                self.cause = cause
+
+        CSVParseError.__qualname__ = "CSVParseError"
+        # Keep the first class if another thread defined it meanwhile
+        return globals().setdefault(name, CSVParseError)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,23 +1,112 @@
+import contextlib
+import functools
+import gzip
+import hashlib
+import io
+import json
 import os
+import re
 import shutil
-import uuid
-from tempfile import gettempdir
-from typing import BinaryIO, Optional, Tuple, cast
+import stat
+import sys
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from tempfile import gettempdir, mkstemp
+from typing import (
+    IO,
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    cast,
+)
+from urllib.error import HTTPError
 from urllib.parse import (
     quote,
     unquote,
+    urljoin,
     urlparse,
     uses_netloc,
     uses_params,
     uses_relative,
 )
-from urllib.request import Request, urlopen
+from urllib.request import Request, build_opener, getproxies, proxy_bypass
 
 from .util import FileLikeObj
 
-_VALID_URLS = set(uses_relative + uses_netloc + uses_params)
-_VALID_URLS.discard("")
+try:
+    import urllib3
+    from urllib3.util.request import ACCEPT_ENCODING
+except ImportError:
+    urllib3 = None  # type: ignore
+
+logger = getLogger(__name__)
+
+_VALID_URLS = frozenset(uses_relative + uses_netloc + uses_params) - {""}
+# Matches URLs with a scheme in _VALID_URLS without calling urlparse. Leading
+# control characters and spaces are skipped in the same way as urlparse.
+_URL_SCHEME_RE = re.compile(
+    r"[\x00-\x20]*(?:{}):".format(
+        "|".join(re.escape(s) for s in sorted(_VALID_URLS, key=len, reverse=True))
+    ),
+    re.IGNORECASE,
+)
 MAX_FILE_SIZE = 200
+# Shared opener for downloads when urllib3 isn't available, or for URLs other
+# than HTTP(S). Compressed responses are decoded in _open_url()
+_OPENER = build_opener()
+_OPENER.addheaders.append(("Accept-Encoding", "gzip"))
+# Buffer size for copying downloaded or file-like contents into a local file.
+# It can be tuned with TABULA_COPY_BUFSIZE environment variable.
+def _env_int(name: str, default: int, minimum: int = 0) -> int:
+    """Read an integer setting from an environment variable.
+
+    A malformed value is ignored with a warning, so that it doesn't break
+    importing tabula.
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        result = int(value)
+    except ValueError:
+        result = minimum - 1
+    if result < minimum:
+        logger.warning(
+            f"{name} must be an integer of at least {minimum}, but got {value!r}."
+            f" Using the default {default} instead."
+        )
+        return default
+    return result
+
+
+COPY_BUFFER_SIZE = _env_int("TABULA_COPY_BUFSIZE", 1 << 20, minimum=1)
+# Persistent download cache used by localize_file(..., use_cache=True). It's
+# private to the user, so that other users can't plant files in it. The base
+# directory can be changed with TABULA_CACHE_DIR environment variable.
+CACHE_DIR = os.path.join(
+    os.environ.get(
+        "TABULA_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "tabula-py"),
+    ),
+    "downloads",
+)
+# Size limit in bytes of each cache directory. The least recently used entries
+# are removed beyond it. It can be changed with TABULA_CACHE_MAX_SIZE.
+CACHE_MAX_SIZE = _env_int("TABULA_CACHE_MAX_SIZE", 1 << 30)
+_CONTENT_RANGE_RE = re.compile(r"bytes\s+(\d+)-\d+/(\d+|\*)")
+_cache_locks: Dict[str, threading.Lock] = {}
+_cache_locks_lock = threading.Lock()
+# Types whose instances are file like. Most callers pass a few types repeatedly.
+_file_like_types: "weakref.WeakSet[type]" = weakref.WeakSet()
 
 
 def localize_file(
@@ -25,6 +114,8 @@ def localize_file(
     user_agent: Optional[str] = None,
     suffix: str = ".pdf",
     use_raw_url=False,
+    use_cache: bool = False,
+    parallel_downloads: int = 1,
 ) -> Tuple[str, bool]:
     """Ensure localize target file.
 
@@ -40,6 +131,15 @@ def localize_file(
             File extension to check.
         use_raw_url (bool):
             Use `path_or_buffer` without quoting/dequoting.
+        use_cache (bool):
+            Keep a downloaded file in ``CACHE_DIR`` and reuse it while the
+            server reports it as not modified. Interrupted downloads are
+            resumed. Cached files aren't temporary files. The least recently
+            used files are removed when the cache exceeds ``CACHE_MAX_SIZE``.
+        parallel_downloads (int):
+            Number of concurrent byte-range requests used to download a
+            remote file. The file is downloaded with a single request if the
+            server doesn't support range requests. Ignored with `use_cache`.
 
     Returns:
         (str, bool):
@@ -48,54 +148,648 @@ def localize_file(
     """
 
     path_or_buffer = _stringify_path(path_or_buffer)
-    safe_with_percent = "!#$%&'()*+,/:;=?@[]~"
 
     if _is_url(path_or_buffer):
-        if not use_raw_url:
-            path_or_buffer = quote(unquote(path_or_buffer), safe=safe_with_percent)
-        if user_agent:
-            req = urlopen(_create_request(path_or_buffer, user_agent))
-        else:
-            req = urlopen(path_or_buffer)
-
-        parsed_url = urlparse(req.geturl())
-        filename = os.path.basename(parsed_url.path)
-        fname, ext = os.path.splitext(filename)
-        filename = f"{fname[:MAX_FILE_SIZE]}{ext}"
-        if ext != suffix:
-            filename = f"{uuid.uuid4()}{suffix}"
-
-        filename = os.path.join(gettempdir(), filename)
-        with open(filename, "wb") as f:
-            shutil.copyfileobj(req, f)
-
-        return filename, True
+        if use_cache:
+            return _download_with_cache(
+                path_or_buffer, user_agent, suffix, use_raw_url
+            ), False
+        return _download(
+            path_or_buffer,
+            user_agent,
+            suffix,
+            use_raw_url,
+            parallel_downloads=parallel_downloads,
+        ), True
 
     elif is_file_like(path_or_buffer):
-        filename = os.path.join(gettempdir(), f"{uuid.uuid4()}{suffix}")
         path_or_buffer = cast(BinaryIO, path_or_buffer)
-        path_or_buffer.seek(0)
 
-        with open(filename, "wb") as f:
-            shutil.copyfileobj(path_or_buffer, f)
+        # A read-only file on disk can be used as is instead of being copied.
+        # Writable ones may have unflushed contents.
+        name = _disk_file_name(path_or_buffer)
+        if name is not None:
+            return name, False
+
+        try:
+            if path_or_buffer.tell():
+                path_or_buffer.seek(0)
+        except (AttributeError, OSError):
+            # Non-seekable streams like pipes are read from where they are
+            pass
+
+        filename, f = _create_temp_file(suffix)
+        with f:
+            _copy_file_like(path_or_buffer, f)
 
         return filename, True
 
     # File path case
     else:
-        return os.path.expanduser(path_or_buffer), False
+        # expanduser() looks up the environment or the password database
+        if path_or_buffer.startswith("~"):
+            path_or_buffer = os.path.expanduser(path_or_buffer)
+        return path_or_buffer, False
+
+
+def _disk_file_name(file: BinaryIO) -> Optional[str]:
+    """Return the path of a read-only regular file object, or None.
+
+    ``name`` alone isn't reliable: wrappers like gzip, tarfile and zipfile
+    members expose the archive's or the member's name, and a relative name
+    goes stale after ``os.chdir()``. So the object has to be a plain
+    :class:`io.FileIO` (possibly buffered) whose descriptor is the file at
+    ``name``.
+    """
+    name = getattr(file, "name", None)
+    if not isinstance(name, str) or not isinstance(
+        getattr(file, "raw", file), io.FileIO
+    ):
+        return None
+
+    try:
+        if file.writable():
+            return None
+        if os.path.samestat(os.fstat(file.fileno()), os.stat(name)):
+            return name
+    except (OSError, ValueError):
+        # e.g. closed files or removed paths
+        pass
+
+    return None
+
+
+def localize_files(
+    paths_or_buffers: Iterable[FileLikeObj],
+    max_workers: int = 8,
+    user_agent: Optional[str] = None,
+    suffix: str = ".pdf",
+    use_raw_url: bool = False,
+    use_cache: bool = False,
+) -> List[Tuple[str, bool]]:
+    """Ensure localize multiple target files.
+
+    Remote files are downloaded concurrently. Other files are handled in the
+    same way as :func:`localize_file()`.
+
+    Args:
+        paths_or_buffers (iterable):
+            File paths or file like objects or URLs of target files.
+        max_workers (int, optional):
+            Maximum number of concurrent downloads. Default: 8
+        user_agent (str, optional):
+            Set a custom user-agent when download a pdf from a url. Otherwise
+            it uses the default ``urllib.request`` user-agent.
+        suffix (str, optional):
+            File extension to check.
+        use_raw_url (bool):
+            Use `paths_or_buffers` without quoting/dequoting.
+        use_cache (bool):
+            Use the persistent download cache. See :func:`localize_file()`.
+
+    Returns:
+        list of (str, bool):
+            list of tuples of str and bool, in the same order as
+            `paths_or_buffers`, which represent file name in local storage and
+            temporary file flag.
+    """
+
+    targets = [_stringify_path(p) for p in paths_or_buffers]
+    results: List[Optional[Tuple[str, bool]]] = [None] * len(targets)
+
+    error: Optional[Exception] = None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            # Downloads must not share a file name while running concurrently
+            idx: (
+                executor.submit(
+                    _download_with_cache, target, user_agent, suffix, use_raw_url
+                )
+                if use_cache
+                else executor.submit(
+                    _download, target, user_agent, suffix, use_raw_url, True
+                )
+            )
+            for idx, target in enumerate(targets)
+            if _is_url(target)
+        }
+
+        for idx, target in enumerate(targets):
+            if idx in futures:
+                continue
+            try:
+                results[idx] = localize_file(target, user_agent, suffix)
+            except Exception as e:
+                error = error or e
+
+        for idx, future in futures.items():
+            try:
+                results[idx] = future.result(), not use_cache
+            except Exception as e:
+                error = error or e
+
+    if error:
+        # Remove localized files since callers can't clean them up
+        for result in results:
+            if result and result[1]:
+                os.unlink(result[0])
+        raise error
+
+    return cast(List[Tuple[str, bool]], results)
+
+
+def _download(
+    url: str,
+    user_agent: Optional[str],
+    suffix: str,
+    use_raw_url: bool,
+    unique_name: bool = False,
+    parallel_downloads: int = 1,
+) -> str:
+    """Download a remote file into the temporary directory.
+
+    Returns:
+        str: file name in local storage
+    """
+    if not use_raw_url:
+        url = _quote_url(url)
+
+    if parallel_downloads > 1 and hasattr(os, "pwrite"):
+        # Probe range support with the first byte. Servers without it send
+        # the whole file, which is copied as usual.
+        headers = {"Range": "bytes=0-0", "Accept-Encoding": "identity"}
+        opened_url = _open_url(url, user_agent, headers)
+    else:
+        opened_url = _open_url(url, user_agent)
+
+    with opened_url as resp:
+        filename = os.path.basename(urlparse(resp.url).path)
+        fname, ext = os.path.splitext(filename)
+        filename = f"{fname[:MAX_FILE_SIZE]}{ext}"
+        f: IO[bytes]
+        if ext != suffix:
+            filename, f = _create_temp_file(suffix)
+        elif unique_name:
+            filename, f = _create_temp_file(f"-{filename}")
+        else:
+            filename = os.path.join(gettempdir(), filename)
+            f = open(filename, "wb")
+
+        with f:
+            match = _CONTENT_RANGE_RE.match(resp.headers.get("Content-Range", ""))
+            if resp.status == 206 and match and match.group(2) != "*":
+                resp.body.read()
+                size = int(match.group(2))
+                _preallocate(f, str(size))
+                _parallel_download(resp.url, user_agent, f, size, parallel_downloads)
+            elif resp.status == 206:
+                # The total size is unknown, download the whole file instead
+                with _open_url(resp.url, user_agent) as full_resp:
+                    _copy_readinto(full_resp.body, f)
+            else:
+                _preallocate(f, resp.content_length)
+                _copy_readinto(resp.body, f)
+
+    return filename
+
+
+def _parallel_download(
+    url: str, user_agent: Optional[str], f: IO[bytes], size: int, n_conn: int
+) -> None:
+    """Download a remote file with concurrent byte-range requests.
+
+    Each range is written into its own slice of `f` with ``os.pwrite``.
+    """
+    fd = f.fileno()
+    chunk_size = -(-size // n_conn)
+
+    def fetch(start: int) -> None:
+        end = min(start + chunk_size, size) - 1
+        headers = {"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"}
+        with _open_url(url, user_agent, headers) as resp:
+            match = _CONTENT_RANGE_RE.match(resp.headers.get("Content-Range", ""))
+            if resp.status != 206 or not match or int(match.group(1)) != start:
+                raise OSError(f"Range request is not supported for {url}")
+            if _copy_readinto_at(resp.body, fd, start) != end - start + 1:
+                raise OSError(f"Incomplete range download for {url}")
+
+    with ThreadPoolExecutor(max_workers=n_conn) as executor:
+        futures = [
+            executor.submit(fetch, start) for start in range(0, size, chunk_size)
+        ]
+        for future in futures:
+            future.result()
+
+
+def _download_with_cache(
+    url: str, user_agent: Optional[str], suffix: str, use_raw_url: bool
+) -> str:
+    """Download a remote file into the persistent cache directory.
+
+    A complete cached file is revalidated with a conditional GET using its
+    ETag / Last-Modified, and a partial one is resumed with a Range request.
+
+    Returns:
+        str: file name in local storage
+    """
+    if not use_raw_url:
+        url = _quote_url(url)
+
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    filename = os.path.join(CACHE_DIR, f"{key}{suffix}")
+    part_path = f"{filename}.part"
+    meta_path = os.path.join(CACHE_DIR, f"{key}.json")
+
+    _make_private_dir(CACHE_DIR)
+    with _cache_lock(key):
+        meta = _read_cache_meta(meta_path)
+        part = meta.get("part") or {}
+        try:
+            have = os.path.getsize(part_path)
+        except OSError:
+            have = 0
+
+        # Byte offsets must refer to the file itself, not a compressed body
+        headers = {"Accept-Encoding": "identity"}
+        part_validator = part.get("etag") or part.get("last_modified")
+        if have and part_validator:
+            headers["Range"] = f"bytes={have}-"
+            headers["If-Range"] = part_validator
+        elif os.path.isfile(filename):
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        with _open_url(url, user_agent, headers) as resp:
+            if resp.status == 304:
+                _touch(filename)
+                return filename
+
+            # Servers may ignore Range or If-Range, then the whole file is sent
+            match = _CONTENT_RANGE_RE.match(resp.headers.get("Content-Range", ""))
+            if resp.status != 206 or not match or int(match.group(1)) != have:
+                have = 0
+
+            part = {}
+            if not resp.headers.get("Content-Encoding"):
+                part["etag"] = resp.headers.get("ETag")
+                part["last_modified"] = resp.headers.get("Last-Modified")
+            meta["part"] = part
+            _write_cache_meta(meta_path, meta)
+
+            # Don't preallocate here, the file size tells how much of an
+            # interrupted download is already written
+            with open(part_path, "ab" if have else "wb") as f:
+                _copy_readinto(resp.body, f)
+
+        # The complete file is moved into place atomically, so a path returned
+        # earlier never shows a file being rewritten
+        os.replace(part_path, filename)
+        _write_cache_meta(meta_path, {"url": url, **part})
+
+    _evict_cache(CACHE_DIR, CACHE_MAX_SIZE, keep=key)
+    return filename
+
+
+def _make_private_dir(path: str) -> None:
+    os.makedirs(path, mode=0o700, exist_ok=True)
+
+
+def _touch(path: str) -> None:
+    # Mark a cache entry as recently used
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
 
+def _evict_cache(directory: str, max_size: int, keep: str = "") -> None:
+    """Remove the least recently used entries of a cache directory.
 
-def _is_url(url: str) -> bool:
+    Files sharing the name before the first ``"."`` form an entry, so that a
+    cached file and its metadata are removed together. Entries are removed
+    oldest first by modification time until the directory fits in
+    `max_size` bytes. Lock files and files being written are left alone, as
+    well as the entry `keep`.
+    """
+    entries: Dict[str, List[Tuple[str, int, float]]] = {}
+    total = 0
     try:
-        return urlparse(url).scheme in _VALID_URLS
+        with os.scandir(directory) as it:
+            for e in it:
+                if not e.is_file() or e.name.endswith((".lock", ".part", ".tmp")):
+                    continue
+                st = e.stat()
+                total += st.st_size
+                key = e.name.split(".", 1)[0]
+                entries.setdefault(key, []).append((e.path, st.st_size, st.st_mtime))
+    except OSError:
+        return
+
+    if total <= max_size:
+        return
+
+    for key, files in sorted(
+        entries.items(), key=lambda item: max(mtime for _, _, mtime in item[1])
+    ):
+        if total <= max_size:
+            break
+        if key == keep:
+            continue
+        for path, size, _ in files:
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                # e.g. it's open on Windows, or another process removed it
+                pass
+
+
+@contextlib.contextmanager
+def _cache_lock(key: str) -> Iterator[None]:
+    """Lock a cache entry against other threads and processes."""
+    with _cache_locks_lock:
+        thread_lock = _cache_locks.setdefault(key, threading.Lock())
+
+    with thread_lock, open(os.path.join(CACHE_DIR, f"{key}.lock"), "ab") as f:
+        _lock_file(f.fileno())
+        try:
+            yield
+        finally:
+            _unlock_file(f.fileno())
+
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        while True:
+            try:
+                # LK_LOCK gives up after 10 seconds, so keep waiting
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+    def _unlock_file(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock_file(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def _read_cache_meta(meta_path: str) -> Dict:
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache_meta(meta_path: str, meta: Dict) -> None:
+    # Replace the metadata atomically so that it's never read half written
+    tmp_path = f"{meta_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, meta_path)
+
+
+@functools.lru_cache(maxsize=128)
+def _quote_url(url: str) -> str:
+    # The same URL is often downloaded repeatedly
+    safe_with_percent = "!#$%&'()*+,/:;=?@[]~"
+    return quote(unquote(url), safe=safe_with_percent)
+
+
+def _create_temp_file(suffix: str) -> Tuple[str, IO[bytes]]:
+    """Create a uniquely named file in the temporary directory.
+
+    Returns:
+        (str, file object): file name and the file opened for binary writing
+    """
+    fd, filename = mkstemp(suffix=suffix)
+    return filename, os.fdopen(fd, "wb")
+
+
+class _Response(NamedTuple):
+    url: str
+    body: BinaryIO
+    content_length: Optional[str]
+    status: int
+    headers: Mapping[str, str]
+
+
+@contextlib.contextmanager
+def _open_url(
+    url: str, user_agent: Optional[str], headers: Optional[Dict[str, str]] = None
+) -> Iterator[_Response]:
+    """Open a URL for download.
 
-    except Exception:
+    HTTP(S) URLs are fetched through a shared urllib3 connection pool if
+    urllib3 is installed, so that connections are kept alive across downloads.
+
+    Args:
+        url (str):
+            URL to be opened.
+        user_agent (str, optional):
+            Custom user-agent.
+        headers (dict, optional):
+            Additional request headers.
+
+    Yields:
+        _Response:
+            The URL after redirects, decoded response body, Content-Length of
+            the body if it is known, HTTP status and response headers.
+            "304 Not Modified" is yielded with an empty body instead of raising.
+    """
+
+    if urllib3 is None or urlparse(url).scheme not in ("http", "https"):
+        try:
+            req = _OPENER.open(_create_request(url, user_agent, headers))
+        except HTTPError as e:
+            if e.code != 304:
+                raise
+            yield _Response(
+                url, io.BytesIO(), None, 304, cast(Mapping[str, str], e.headers)
+            )
+            return
+
+        with req:
+            status = req.status or 200
+            if req.headers.get("Content-Encoding") == "gzip":
+                body = cast(BinaryIO, gzip.GzipFile(fileobj=req))
+                yield _Response(req.geturl(), body, None, status, req.headers)
+            else:
+                content_length = req.headers.get("Content-Length")
+                yield _Response(req.geturl(), req, content_length, status, req.headers)
+        return
+
+    # Every encoding urllib3 can decode, e.g. gzip, deflate and br if brotli
+    # is installed
+    request_headers = {"Accept-Encoding": ACCEPT_ENCODING}
+    if user_agent:
+        request_headers["User-Agent"] = user_agent
+    if headers:
+        request_headers.update(headers)
+
+    resp = _pool_manager(url).request(
+        "GET", url, headers=request_headers, preload_content=False
+    )
+    try:
+        if resp.status >= 400:
+            raise HTTPError(
+                url,
+                resp.status,
+                resp.reason or "",
+                resp.headers,  # type: ignore
+                None,
+            )
+
+        # urllib3 decodes the body, so Content-Length is only valid if the
+        # response isn't compressed
+        content_length = None
+        if not resp.headers.get("Content-Encoding"):
+            content_length = resp.headers.get("Content-Length")
+        # HTTPResponse.url is new in urllib3 2.x, geturl() works on 1.26 too
+        yield _Response(
+            urljoin(url, resp.geturl() or ""),
+            cast(BinaryIO, resp),
+            content_length,
+            resp.status,
+            resp.headers,
+        )
+    finally:
+        resp.release_conn()
+
+
+def _pool_manager(url: str) -> "urllib3.PoolManager":
+    # Respect proxy environment variables like urllib does
+    parsed_url = urlparse(url)
+    proxy = getproxies().get(parsed_url.scheme)
+    if proxy and not proxy_bypass(parsed_url.hostname or ""):
+        return _create_pool_manager(proxy)
+    return _create_pool_manager(None)
+
+
+@functools.lru_cache(maxsize=None)
+def _create_pool_manager(proxy: Optional[str]) -> "urllib3.PoolManager":
+    if proxy:
+        return urllib3.ProxyManager(proxy)
+    return urllib3.PoolManager()
+
+
+def _is_url(url: FileLikeObj) -> bool:
+    if not isinstance(url, str):
         return False
 
+    return _URL_SCHEME_RE.match(url) is not None
+
+
+def _copy_file_like(src: BinaryIO, dst: IO[bytes]) -> None:
+    """Copy the whole content of src into dst.
+
+    If src is backed by a regular file, the copy is done in the kernel with
+    ``os.sendfile`` where it is available. The buffer of ``io.BytesIO`` is
+    written at once without copying it.
+    """
+    if isinstance(src, io.BytesIO):
+        with src.getbuffer() as view, view[src.tell() :] as rest:
+            dst.write(rest)
+        return
+
+    # Wrappers such as gzip.GzipFile return the descriptor of the underlying
+    # file from fileno(), so only plain file objects are copied by descriptor.
+    try:
+        src_fd = src.fileno()
+        is_regular_file = isinstance(
+            getattr(src, "raw", src), io.FileIO
+        ) and stat.S_ISREG(os.fstat(src_fd).st_mode)
+    except (AttributeError, OSError, ValueError):
+        is_regular_file = False
+
+    if is_regular_file and hasattr(os, "sendfile"):
+        dst.flush()
+        size = os.fstat(src_fd).st_size
+        _preallocate(dst, str(size))
+        offset = 0
+        try:
+            while offset < size:
+                sent = os.sendfile(dst.fileno(), src_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            return
+        except OSError:
+            if offset > 0:
+                raise
+
+    _copy_readinto(src, dst)
+
+
+def _copy_readinto(src: BinaryIO, dst: IO[bytes]) -> None:
+    """Copy src into dst reusing a single buffer instead of a bytes per read."""
+    if not hasattr(src, "readinto"):
+        shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+        return
+
+    buf = bytearray(COPY_BUFFER_SIZE)
+    with memoryview(buf) as view:
+        while True:
+            n = src.readinto(view)
+            if not n:
+                break
+            dst.write(view[:n])
+
+
+def _copy_readinto_at(src: BinaryIO, fd: int, offset: int) -> int:
+    """Copy src into the file descriptor from offset with ``os.pwrite``.
 
-def _create_request(path_or_buffer: str, user_agent: str) -> Request:
-    req_headers = {"User-Agent": user_agent}
+    Returns:
+        int: number of bytes copied
+    """
+    buf = bytearray(COPY_BUFFER_SIZE)
+    copied = 0
+    with memoryview(buf) as view:
+        while True:
+            n = src.readinto(view)  # type: ignore
+            if not n:
+                break
+            written = 0
+            while written < n:
+                written += os.pwrite(fd, view[written:n], offset + copied + written)
+            copied += n
+    return copied
+
+
+def _preallocate(f: IO[bytes], content_length: Optional[str]) -> None:
+    """Reserve disk space for a download whose size is known in advance."""
+    try:
+        size = int(content_length)  # type: ignore
+        if size > 0:
+            os.posix_fallocate(f.fileno(), 0, size)
+    except (AttributeError, OSError, TypeError, ValueError):
+        # posix_fallocate isn't available on some platforms like Windows/macOS
+        pass
+
+
+def _create_request(
+    path_or_buffer: str,
+    user_agent: Optional[str],
+    headers: Optional[Dict[str, str]] = None,
+) -> Request:
+    req_headers = dict(headers or {})
+    if user_agent:
+        req_headers["User-Agent"] = user_agent
     return Request(path_or_buffer, headers=req_headers)
 
 
@@ -110,13 +804,24 @@ def is_file_like(obj: FileLikeObj) -> bool:
         bool: file like object or not
     """
 
-    if not (hasattr(obj, "read") or hasattr(obj, "write")):
-        return False
+    if isinstance(obj, io.IOBase):
+        return True
 
-    if not hasattr(obj, "__iter__"):
-        return False
+    obj_type = type(obj)
+    if obj_type in _file_like_types:
+        return True
+    if _has_file_methods(obj_type):
+        _file_like_types.add(obj_type)
+        return True
+
+    # The methods may be set on the object itself, which can't be cached
+    return _has_file_methods(obj)
 
-    return True
+
+def _has_file_methods(obj: Any) -> bool:
+    return (hasattr(obj, "read") or hasattr(obj, "write")) and hasattr(
+        obj, "__iter__"
+    )
 
 
 def _stringify_path(path_or_buffer: FileLikeObj) -> str:
@@ -129,19 +834,7 @@ def _stringify_path(path_or_buffer: FileLikeObj) -> str:
         string_path_or_buffer: maybe string version of path_or_buffer
     """
 
-    try:
-        import pathlib
-
-        _PATHLIB_INSTALLED = True
-    except ImportError:
-        _PATHLIB_INSTALLED = False
-
     if hasattr(path_or_buffer, "__fspath__"):
-        path_or_buffer = cast(os.PathLike, path_or_buffer)
-        return path_or_buffer.__fspath__()
-
-    if _PATHLIB_INSTALLED and isinstance(path_or_buffer, pathlib.Path):
-        return str(path_or_buffer)
+        return os.fspath(cast(os.PathLike, path_or_buffer))
 
-    path_or_buffer = cast(str, path_or_buffer)
-    return path_or_buffer
+    return cast(str, path_or_buffer)
@@ -16,31 +16,98 @@ Example:
     >>> dfs = tabula.read_pdf("/path/to/sample.pdf", pages="all")
 """
 
+from __future__ import annotations
+
+import contextlib
 import errno
+import functools
+import hashlib
 import io
 import json
 import os
 import platform
 import shlex
+import tempfile
 from collections import defaultdict
-from copy import deepcopy
-from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from dataclasses import asdict, replace
 from logging import getLogger
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
-
-import numpy as np
-import pandas as pd
-
-from .backend import SubprocessTabula, TabulaVm
-from .errors import CSVParseError
-from .file_util import localize_file
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from .backend import SubprocessTabula, TabulaVm, jar_path
+from .file_util import (
+    CACHE_MAX_SIZE,
+    _evict_cache,
+    _is_url,
+    _make_private_dir,
+    _touch,
+    localize_file,
+)
 from .template import load_template
 from .util import FileLikeObj, TabulaOption
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    from orjson import loads as _json_loads
+
+    _HAS_ORJSON = True
+except ImportError:
+    from json import loads as _json_loads  # type: ignore
+
+    _HAS_ORJSON = False
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Streaming with ijson saves memory but is slower than decoding at once, much
+# slower with its pure Python backends. So it's used only with the C backend
+# and when orjson, the fastest option, isn't installed.
+_STREAM_JSON = (
+    not _HAS_ORJSON and ijson is not None and ijson.backend in ("yajl2_c", "yajl2_cffi")
+)
+
 logger = getLogger(__name__)
 
 
 _tabula_vm: Optional[Union[TabulaVm, SubprocessTabula]] = None
+# Java options the JVM of TabulaVm was started with
+_jvm_java_options: FrozenSet[str] = frozenset()
+
+# Ignore some options that are set by tabula-py
+_IGNORED_JAVA_OPTIONS = frozenset(
+    (
+        "-Djava.awt.headless=true",
+        "-Dfile.encoding=UTF8",
+        "-Dorg.slf4j.simpleLogger.defaultLogLevel=off",
+        "-Dorg.apache.commons.logging.Log=org.apache.commons.logging.impl.NoOpLog",
+    )
+)
+
+# tabula-java formats for output_format of convert_into()
+_CONVERSION_FORMATS = {"csv": "CSV", "json": "JSON", "tsv": "TSV"}
+
+# Directory for tabula-java outputs cached by read_pdf(..., cache=True).
+# It can be changed with TABULA_CACHE_DIR environment variable.
+OUTPUT_CACHE_DIR = os.environ.get(
+    "TABULA_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "tabula-py")
+)
 
 
 def _run(
@@ -54,36 +121,85 @@ def _run(
     options, as well as an optional path to pass to tabula-java as a regular
     argument to use for any required output sent to stderr.
     """
-    # Ignore some options that are set by tabula-py
-    IGNORED_JAVA_OPTIONS = {
-        "-Djava.awt.headless=true",
-        "-Dfile.encoding=UTF8",
-        "-Dorg.slf4j.simpleLogger.defaultLogLevel=off",
-        "-Dorg.apache.commons.logging.Log=org.apache.commons.logging.impl.NoOpLog",
-    }
-
     java_options = _build_java_options(java_options, encoding)
+    tabula_vm = _init_tabula_vm(
+        java_options, options.silent, encoding, force_subprocess
+    )
+    return tabula_vm.call_tabula_java(options, path)
+
 
-    global _tabula_vm
+def _init_tabula_vm(
+    java_options: List[str],
+    silent: Optional[bool],
+    encoding: str,
+    force_subprocess: bool,
+) -> Union[TabulaVm, SubprocessTabula]:
+    global _tabula_vm, _jvm_java_options
     if force_subprocess:
         _tabula_vm = SubprocessTabula(
-            java_options=java_options, silent=options.silent, encoding=encoding
+            java_options=java_options, silent=silent, encoding=encoding
         )
 
     if not _tabula_vm:
-        _tabula_vm = TabulaVm(java_options=java_options, silent=options.silent)
+        _jvm_java_options = frozenset(java_options)
+        _tabula_vm = TabulaVm(java_options=java_options, silent=silent)
         if _tabula_vm and not _tabula_vm.tabula:
             _tabula_vm = SubprocessTabula(
-                java_options=java_options, silent=options.silent, encoding=encoding
+                java_options=java_options, silent=silent, encoding=encoding
             )
     elif isinstance(_tabula_vm, SubprocessTabula):
         _tabula_vm.update_encoding(
-            encoding=encoding, java_options=java_options, silent=options.silent
+            encoding=encoding, java_options=java_options, silent=silent
         )
-    elif set(java_options) - IGNORED_JAVA_OPTIONS:
+    elif set(java_options) - _IGNORED_JAVA_OPTIONS - _jvm_java_options:
         logger.warning("java_options is ignored until rebooting the Python process.")
 
-    return _tabula_vm.call_tabula_java(options, path)
+    return _tabula_vm
+
+
+def _localize_input(
+    input_path: FileLikeObj,
+    java_options: Optional[List[str]],
+    encoding: str,
+    silent: Optional[bool],
+    force_subprocess: bool,
+    user_agent: Optional[str] = None,
+    use_raw_url: bool = False,
+    use_cache: bool = False,
+) -> Tuple[str, bool]:
+    """Localize the input file, starting the JVM meanwhile for a URL.
+
+    The first call of the process otherwise pays the JVM start-up after the
+    download has finished.
+    """
+    if _tabula_vm is None and not force_subprocess and _is_url(input_path):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            download = executor.submit(
+                localize_file,
+                input_path,
+                user_agent,
+                use_raw_url=use_raw_url,
+                use_cache=use_cache,
+            )
+            try:
+                _init_tabula_vm(
+                    _build_java_options(java_options, encoding),
+                    silent,
+                    encoding,
+                    False,
+                )
+            except BaseException:
+                # Don't leak the downloaded file when the JVM fails to start
+                with contextlib.suppress(Exception):
+                    path, temporary = download.result()
+                    if temporary:
+                        os.unlink(path)
+                raise
+            return download.result()
+
+    return localize_file(
+        input_path, user_agent, use_raw_url=use_raw_url, use_cache=use_cache
+    )
 
 
 def read_pdf(
@@ -110,7 +226,9 @@ def read_pdf(
     output_path: Optional[str] = None,
     force_subprocess: bool = False,
     options: str = "",
-) -> Union[List[pd.DataFrame], Dict[str, Any]]:
+    workers: int = 1,
+    cache: bool = False,
+) -> Union[List[pd.DataFrame], List[Dict[str, Any]]]:
     """Read tables in PDF.
 
     Args:
@@ -137,6 +255,8 @@ def read_pdf(
                 With ``multiple_tables=True`` (default), pandas_options is passed
                 to pandas.DataFrame, otherwise it is passed to pandas.read_csv.
                 Those two functions are different for accept options like ``dtype``.
+                For large outputs with ``multiple_tables=False``,
+                ``{'engine': 'pyarrow'}`` parses faster if pyarrow is installed.
         multiple_tables (bool):
             It enables to handle multiple tables within a page. Default: ``True``
 
@@ -218,9 +338,23 @@ def read_pdf(
             Default ``False``.
         options (str, optional):
             Raw option string for tabula-java.
+        workers (int, optional):
+            Number of tabula-java processes extracting tables concurrently.
+            The pages are split into contiguous groups, one per process. It
+            takes effect only with ``force_subprocess=True``, JSON output, and
+            `pages` given as page numbers or ranges rather than ``"all"``.
+            Default: 1
+        cache (bool, optional):
+            Store the tabula-java output in ``OUTPUT_CACHE_DIR`` and reuse it
+            for later calls with the same PDF contents and options, skipping
+            tabula-java entirely. A PDF given by URL is also kept in the
+            download cache and only revalidated with the server by later
+            calls. Each cache is limited to ``TABULA_CACHE_MAX_SIZE`` bytes
+            (1 GiB by default), and the least recently used entries are
+            removed beyond it. Default: ``False``
 
     Returns:
-        list of DataFrames or dict.
+        list of DataFrames, or list of dicts for ``output_format="json"``.
 
     Raises:
         FileNotFoundError:
@@ -388,22 +522,50 @@ def read_pdf(
         multiple_tables=multiple_tables,
     )
 
-    path, temporary = localize_file(input_path, user_agent, use_raw_url=use_raw_url)
+    path, temporary = _localize_input(
+        input_path,
+        java_options,
+        encoding,
+        silent,
+        force_subprocess,
+        user_agent=user_agent,
+        use_raw_url=use_raw_url,
+        use_cache=cache,
+    )
 
-    if not os.path.exists(path):
-        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), path)
+    _check_input_file(path)
 
-    if os.path.getsize(path) == 0:
-        raise ValueError(f"{path} is empty. Check the file, or download it manually.")
+    page_groups = None
+    if workers > 1 and force_subprocess and tabula_options.format == "JSON":
+        page_groups = _split_pages(pages, workers)
+
+    # Outputs written into files by tabula-java can't be reused
+    cache = cache and not (output_path or batch)
 
     try:
-        output = _run(
-            tabula_options,
-            java_options,
-            path,
-            encoding=encoding,
-            force_subprocess=force_subprocess,
-        )
+        output = None
+        if cache:
+            cache_path = _output_cache_path(
+                path, tabula_options, java_options, encoding
+            )
+            output = _read_output_cache(cache_path)
+
+        if output is None:
+            if page_groups:
+                output = _run_page_groups(
+                    tabula_options, java_options, path, encoding, page_groups
+                )
+            else:
+                output = _run(
+                    tabula_options,
+                    java_options,
+                    path,
+                    encoding=encoding,
+                    force_subprocess=force_subprocess,
+                )
+
+            if cache:
+                _write_output_cache(cache_path, output)
     finally:
         if temporary:
             os.unlink(path)
@@ -412,23 +574,34 @@ def read_pdf(
         logger.warning("The output file is empty.")
         return []
 
-    if pandas_options is None:
-        pandas_options = {}
-
-    _pandas_options = deepcopy(pandas_options)
     fmt = tabula_options.format
+    if fmt == "JSON" and not multiple_tables:
+        # Raw JSON is requested, so neither pandas nor its options are needed
+        raw_json: List[Any] = _json_loads(output)
+        return raw_json
+
     if fmt == "JSON":
-        raw_json: List[Any] = json.loads(output)
-        if multiple_tables:
-            return _extract_from(raw_json, _pandas_options)
-        else:
-            return raw_json
+        return _extract_from(_iter_json_tables(output), pandas_options)
 
     else:
+        # pandas is imported on demand since it takes long to import
+        import pandas as pd
+
+        from .errors import CSVParseError
+
+        # Only top-level keys are added or removed, so a shallow copy is enough
+        _pandas_options = dict(pandas_options or {})
         _pandas_options["encoding"] = _pandas_options.get("encoding", encoding)
 
+        csv_buffer: Union[io.StringIO, io.BytesIO] = io.StringIO(output)
+        if _pandas_options.get("engine") == "pyarrow":
+            # pyarrow reads bytes natively rather than through a text wrapper.
+            # The output is already decoded, so it's re-encoded as UTF-8.
+            csv_buffer = io.BytesIO(output.encode("utf-8"))
+            _pandas_options["encoding"] = "utf-8"
+
         try:
-            return [pd.read_csv(io.StringIO(output), **_pandas_options)]
+            return [pd.read_csv(csv_buffer, **_pandas_options)]
         except pd.errors.ParserError as e:
             message = "Error failed to create DataFrame with different column tables.\n"
             message += (
@@ -462,6 +635,8 @@ def read_pdf_with_template(
     output_path: Optional[str] = None,
     force_subprocess: bool = False,
     options: Optional[str] = None,
+    cache: bool = False,
+    workers: int = 1,
 ) -> List[pd.DataFrame]:
     """Read tables in PDF with a Tabula App template.
 
@@ -553,6 +728,13 @@ def read_pdf_with_template(
             Default ``False``.
         options (str, optional):
             Raw option string for tabula-java.
+        cache (bool, optional):
+            Reuse cached tabula-java output. See :func:`read_pdf()`.
+            Default: ``False``
+        workers (int, optional):
+            Number of template entries extracted concurrently by threads. The
+            JVM releases the GIL while extracting, so the entries run in
+            parallel with both backends. Default: 1
 
     Returns:
         list of DataFrame.
@@ -667,24 +849,60 @@ def read_pdf_with_template(
     )
     dataframes = []
 
+    def read(input_path: FileLikeObj, option: TabulaOption) -> List[Any]:
+        # TabulaOption is frozen, so its fields can be passed as they are
+        # instead of deep-copying them with asdict().
+        return read_pdf(
+            input_path,
+            pandas_options=pandas_options,
+            encoding=encoding,
+            java_options=java_options,
+            force_subprocess=force_subprocess,
+            cache=cache,
+            **vars(_force_option.merge(option)),
+        )
+
+    input_temporary = False
     try:
-        for option in _options:
-            _df = read_pdf(
-                input_path,
-                pandas_options=pandas_options,
-                encoding=encoding,
-                java_options=java_options,
-                force_subprocess=force_subprocess,
-                **asdict(_force_option.merge(option)),
+        # The PDF is localized only once rather than downloaded or copied for
+        # every template entry. It also lets threads share a file-like input.
+        input_path, input_temporary = _localize_input(
+            input_path,
+            java_options,
+            encoding,
+            silent,
+            force_subprocess,
+            user_agent=user_agent,
+            use_raw_url=use_raw_url,
+            use_cache=cache,
+        )
+
+        if workers > 1 and len(_options) > 1:
+            # Start the backend before the threads so that they don't race to
+            # start the JVM
+            _init_tabula_vm(
+                _build_java_options(java_options, encoding),
+                silent,
+                encoding,
+                force_subprocess,
             )
+            with ThreadPoolExecutor(
+                max_workers=min(workers, len(_options))
+            ) as executor:
+                results = list(
+                    executor.map(functools.partial(read, input_path), _options)
+                )
+        else:
+            results = [read(input_path, option) for option in _options]
 
-            if isinstance(_df, list):
-                dataframes.extend(_df)
-            else:
-                dataframes.append(_df)
+        # read_pdf() always returns a list
+        for _dfs in results:
+            dataframes.extend(_dfs)
     finally:
         if temporary:
             os.unlink(path)
+        if input_temporary:
+            os.unlink(cast(str, input_path))
 
     return dataframes
 
@@ -823,13 +1041,11 @@ def convert_into(
         options=options,
     )
 
-    path, temporary = localize_file(input_path)
-
-    if not os.path.exists(path):
-        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), path)
+    path, temporary = _localize_input(
+        input_path, java_options, "utf-8", silent, force_subprocess
+    )
 
-    if os.path.getsize(path) == 0:
-        raise ValueError(f"{path} is empty. Check the file, or download it manually.")
+    _check_input_file(path)
 
     try:
         _run(tabula_options, java_options, path, force_subprocess=force_subprocess)
@@ -856,6 +1072,7 @@ def convert_into_by_batch(
     output_path: Optional[str] = None,
     force_subprocess: bool = False,
     options: str = "",
+    workers: int = 1,
 ) -> None:
     """Convert tables from PDFs in a directory.
 
@@ -929,6 +1146,10 @@ def convert_into_by_batch(
             Default ``False``.
         options (str, optional):
             Raw option string for tabula-java.
+        workers (int, optional):
+            Number of PDFs converted concurrently by threads. Each thread
+            runs its own tabula-java process with ``force_subprocess=True``,
+            and shares the JVM otherwise. Default: 1
 
     Returns:
         Nothing. Outputs are saved into the same directory with `input_dir`
@@ -960,66 +1181,295 @@ def convert_into_by_batch(
         options=options,
     )
 
-    _run(tabula_options, java_options, force_subprocess=force_subprocess)
+    if workers > 1:
+        _run_batch(tabula_options, java_options, input_dir, workers, force_subprocess)
+    else:
+        _run(tabula_options, java_options, force_subprocess=force_subprocess)
+
+
+def _run_batch(
+    options: TabulaOption,
+    java_options: Optional[List[str]],
+    input_dir: str,
+    workers: int,
+    force_subprocess: bool,
+) -> None:
+    """Convert PDFs in a directory concurrently, one tabula-java call per file.
+
+    With the JPype backend the calls share the JVM, which releases the GIL
+    while extracting. Output files are named in the same way as ``--batch``
+    of tabula-java.
+    """
+    extension = f".{cast(str, options.format).lower()}"
+
+    def run(pdf_path: str) -> None:
+        output_path = pdf_path[: -len(".pdf")] + extension
+        _run(
+            replace(options, batch=None, output_path=output_path),
+            copy(java_options),
+            pdf_path,
+            force_subprocess=force_subprocess,
+        )
+
+    if not force_subprocess:
+        # Start the JVM before the threads so that they don't race to start it
+        _init_tabula_vm(
+            _build_java_options(java_options, "utf-8"), options.silent, "utf-8", False
+        )
+
+    pdf_paths = [
+        entry.path
+        for entry in os.scandir(input_dir)
+        if entry.name.endswith(".pdf") and entry.is_file()
+    ]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Consume the results to raise the first error
+        list(executor.map(run, pdf_paths))
+
+
+def _check_input_file(path: str) -> None:
+    # A single stat for both the existence and the size
+    try:
+        size = os.stat(path).st_size
+    except OSError:
+        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), path)
+
+    if size == 0:
+        raise ValueError(f"{path} is empty. Check the file, or download it manually.")
+
+
+def _output_cache_path(
+    path: str,
+    options: TabulaOption,
+    java_options: Optional[List[str]],
+    encoding: str,
+) -> str:
+    """Build the cache file path for tabula-java output.
+
+    The key is a hash of the PDF contents, the options and the JAR path.
+    """
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+
+    key = json.dumps(
+        [asdict(options), java_options, encoding, jar_path()],
+        sort_keys=True,
+        default=str,
+    )
+    digest.update(key.encode("utf-8"))
+    return os.path.join(OUTPUT_CACHE_DIR, f"{digest.hexdigest()}.txt")
+
+
+def _read_output_cache(cache_path: str) -> Optional[str]:
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            output = f.read()
+    except FileNotFoundError:
+        return None
+
+    _touch(cache_path)
+    return output
+
+
+def _write_output_cache(cache_path: str, output: str) -> None:
+    cache_dir, name = os.path.split(cache_path)
+    tmp_path = None
+    try:
+        _make_private_dir(cache_dir)
+        # Replace the file atomically so that it's never read half written.
+        # The temporary file is unique per call since concurrent extractions
+        # may share a cache key.
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=cache_dir)
+        with open(fd, "w", encoding="utf-8") as f:
+            f.write(output)
+        os.replace(tmp_path, cache_path)
+        tmp_path = None
+    except OSError as e:
+        # Caching is best effort and mustn't fail the extraction
+        logger.warning(f"Failed to write the output cache {cache_path}: {e}")
+        return
+    finally:
+        if tmp_path is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+
+    _evict_cache(cache_dir, CACHE_MAX_SIZE, keep=name.split(".", 1)[0])
+
+
+def _split_pages(
+    pages: Optional[Union[str, int, Iterable[int]]], n_groups: int
+) -> Optional[List[List[int]]]:
+    """Split page numbers into contiguous groups for concurrent extraction.
+
+    Returns:
+        list of list of int or None:
+            Page numbers of each group, or None if `pages` aren't explicit
+            page numbers like ``"all"`` or if there is only one page.
+    """
+    page_numbers: List[int] = []
+    if isinstance(pages, int):
+        page_numbers = [pages]
+    elif isinstance(pages, str):
+        for page_range in pages.split(","):
+            first, sep, last = page_range.strip().partition("-")
+            if not sep:
+                last = first
+            if not (first.isdigit() and last.isdigit()):
+                return None
+            page_numbers.extend(range(int(first), int(last) + 1))
+    elif pages is not None:
+        page_numbers = list(pages)
+
+    if len(page_numbers) < 2:
+        return None
+
+    group_size = -(-len(page_numbers) // n_groups)
+    return [
+        page_numbers[i : i + group_size]
+        for i in range(0, len(page_numbers), group_size)
+    ]
+
+
+def _run_page_groups(
+    options: TabulaOption,
+    java_options: Optional[List[str]],
+    path: str,
+    encoding: str,
+    page_groups: List[List[int]],
+) -> str:
+    """Run tabula-java subprocesses per page group concurrently.
+
+    Returns:
+        str: JSON array of tables from all groups in page order
+    """
+
+    def run(pages: List[int]) -> str:
+        return _run(
+            replace(options, pages=pages),
+            copy(java_options),
+            path,
+            encoding=encoding,
+            force_subprocess=True,
+        )
+
+    with ThreadPoolExecutor(max_workers=len(page_groups)) as executor:
+        outputs = list(executor.map(run, page_groups))
+
+    # Join the JSON arrays without decoding them
+    tables = [output.strip()[1:-1].strip() for output in outputs if output.strip()]
+    return "[" + ",".join(table for table in tables if table) + "]"
 
 
 def _build_java_options(
     _java_options: Optional[List[str]] = None, encoding: str = "utf-8"
 ) -> List[str]:
     if _java_options is None:
-        _java_options = []
+        key: Union[str, Tuple[str, ...]] = ()
     elif isinstance(_java_options, str):
-        _java_options = shlex.split(_java_options)
+        key = _java_options
+    else:
+        key = tuple(_java_options)
+
+    # Return a new list since backends extend it
+    return list(_build_java_options_cached(key, encoding))
+
+
+@functools.lru_cache(maxsize=8)
+def _build_java_options_cached(
+    _java_options: Union[str, Tuple[str, ...]], encoding: str
+) -> Tuple[str, ...]:
+    if isinstance(_java_options, str):
+        java_options = shlex.split(_java_options)
+    else:
+        java_options = list(_java_options)
 
     # to prevent tabula-py from stealing focus on every call on mac
     if platform.system() == "Darwin":
-        r = "java.awt.headless"
-        if not any(filter(r.find, _java_options)):  # type: ignore
-            _java_options = _java_options + ["-Djava.awt.headless=true"]
+        if not any("java.awt.headless" in opt for opt in java_options):
+            java_options = java_options + ["-Djava.awt.headless=true"]
 
     if encoding == "utf-8":
-        if not any("file.encoding" in opt for opt in _java_options):
-            _java_options += ["-Dfile.encoding=UTF8"]
+        if not any("file.encoding" in opt for opt in java_options):
+            java_options += ["-Dfile.encoding=UTF8"]
 
-    return _java_options
+    return tuple(java_options)
 
 
 def _extract_format_for_conversion(output_format: str = "csv") -> str:
-    if output_format.lower() == "csv":
-        return "CSV"
-    elif output_format.lower() == "json":
-        return "JSON"
-    elif output_format.lower() == "tsv":
-        return "TSV"
-    else:
-        raise ValueError(f"Unknown {output_format=}")
+    try:
+        return _CONVERSION_FORMATS[output_format.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown {output_format=}") from None
+
+
+def _iter_json_tables(output: str) -> Iterable[Dict[str, Any]]:
+    """Decode tables in tabula-java JSON output.
+
+    The output is decoded at once, with orjson if it is installed. Otherwise,
+    if ijson with a C backend is installed, tables are decoded one by one so
+    that the whole JSON tree isn't kept in memory while DataFrames are built.
+    """
+    if not _STREAM_JSON:
+        return _json_loads(output)
+
+    return ijson.items(_Utf8Reader(output), "item", use_float=True)
+
+
+class _Utf8Reader:
+    """Binary file-like view of a str, encoded to UTF-8 chunk by chunk."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.pos = 0
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            size = len(self.text) - self.pos
+        chunk = self.text[self.pos : self.pos + size]
+        self.pos += len(chunk)
+        return chunk.encode("utf-8")
 
 
 def _extract_from(
-    raw_json: List[Any], pandas_options: Optional[Dict[str, Any]] = None
+    raw_json: Iterable[Any], pandas_options: Optional[Dict[str, Any]] = None
 ) -> List[pd.DataFrame]:
     """Extract tables from json.
 
     Args:
-        raw_json (list):
-            Decoded list from tabula-java JSON.
+        raw_json (iterable):
+            Decoded tables from tabula-java JSON.
         pandas_options (dict optional):
             pandas options for `pd.DataFrame()`
     """
 
-    data_frames = []
-    if pandas_options is None:
-        pandas_options = {}
+    import numpy as np
+    import pandas as pd
 
-    columns = pandas_options.pop("columns", None)
-    columns, header_line_number = _convert_pandas_csv_options(pandas_options, columns)
+    data_frames = []
+    pandas_options, columns, header_line_number = _convert_pandas_csv_options(
+        pandas_options or {}
+    )
+    # pd.DataFrame() doesn't take converters, so they are applied afterwards
+    converters = pandas_options.pop("converters", None) or {}
+    # Numeric columns are inferred only when no dtype is given
+    infer_numeric = not pandas_options.get("dtype")
+    nan = np.nan
+    # Equal cell texts share one str through this pool, which is freed with
+    # the call unlike sys.intern() whose strings are immortal on 3.12+.
+    texts: Dict[str, str] = {}
+    dedup = texts.setdefault
 
     for table in raw_json:
         if len(table["data"]) == 0:
             continue
 
+        # Empty cells become NaN. This loop dominates for large tables, so
+        # look up each cell only once. Tables repeat many texts, so equal ones
+        # are deduplicated and object columns then share a single str.
         list_data = [
-            [np.nan if not e["text"] else e["text"] for e in row]
+            [dedup(text, text) if (text := e["text"]) else nan for e in row]
             for row in table["data"]
         ]
         _columns = columns
@@ -1028,7 +1478,7 @@ def _extract_from(
             _columns = list_data.pop(header_line_number)
             _unname_idx = 0
             for idx, col in enumerate(_columns):
-                if col is np.nan:
+                if col is nan:
                     _columns[idx] = f"Unnamed: {_unname_idx}"
                     _unname_idx += 1
 
@@ -1048,8 +1498,17 @@ def _extract_from(
 
         df = pd.DataFrame(data=list_data, columns=_columns, **pandas_options)
 
-        if not pandas_options.get("dtype"):
-            for c in df.columns:
+        for c, converter in converters.items():
+            if c in df.columns:
+                # Like pd.read_csv(), converters get "" for empty cells
+                df[c] = df[c].fillna("").map(converter)
+
+        if infer_numeric:
+            for c, dtype in df.dtypes.items():
+                # e.g. all-NaN columns are float already. Converted columns
+                # are typed by their converters.
+                if dtype.kind in "biufc" or c in converters:
+                    continue
                 try:
                     df[c] = pd.to_numeric(df[c], errors="raise")
                 except (ValueError, TypeError):
@@ -1062,24 +1521,30 @@ def _extract_from(
 
 
 def _convert_pandas_csv_options(
-    pandas_options: Dict[str, Any], columns: Iterable[str]
-) -> Tuple[str, Optional[int]]:
+    pandas_options: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Optional[Iterable[str]], Optional[int]]:
     """Translate `pd.read_csv()` options into `pd.DataFrame()` especially for header.
 
     Args:
         pandas_options (dict):
-            pandas options like {'header': None}.
-        columns (iterable):
-            iterable of column name.
+            pandas options like {'header': None}. It isn't modified.
+
+    Returns:
+        tuple: options for `pd.DataFrame()` except columns, column names, and
+        the line number of the header
     """
 
-    _columns = pandas_options.pop("names", columns)
-    header = pandas_options.pop("header", "infer")
-    pandas_options.pop("encoding", None)
+    _columns = pandas_options.get("names", pandas_options.get("columns"))
+    header = pandas_options.get("header", "infer")
+    options = {
+        k: v
+        for k, v in pandas_options.items()
+        if k not in ("columns", "names", "header", "encoding")
+    }
 
     if header == "infer":
         header_line_number = 0 if not bool(_columns) else None
     else:
         header_line_number = header
 
-    return _columns, header_line_number
+    return options, _columns, header_line_number
@@ -1,9 +1,15 @@
-import json
-from typing import Dict, Iterable, List, TextIO, Union, cast
+from dataclasses import replace
+from operator import itemgetter
+from typing import IO, Any, Dict, Iterable, List, Tuple, Union, cast
 
 from .file_util import _stringify_path, is_file_like
 from .util import FileLikeObj, TabulaOption
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads  # type: ignore
+
 
 def load_template(path_or_buffer: FileLikeObj) -> List[TabulaOption]:
     """Build tabula-py option from template file
@@ -16,34 +22,33 @@ def load_template(path_or_buffer: FileLikeObj) -> List[TabulaOption]:
         dict: tabula-py options
     """
 
-    from itertools import groupby
-    from operator import itemgetter
-
     path_or_buffer = _stringify_path(path_or_buffer)
 
+    # Both parsers take str or bytes, so buffers can be in text or binary mode
     if is_file_like(path_or_buffer):
-        path_or_buffer = cast(TextIO, path_or_buffer)
-        templates = json.load(path_or_buffer)
+        path_or_buffer = cast(IO, path_or_buffer)
+        templates = _json_loads(path_or_buffer.read())
     else:
-        with open(path_or_buffer, "r") as f:
-            templates = json.load(f)
+        with open(path_or_buffer, "rb") as f:
+            templates = _json_loads(f.read())
 
     options = []
 
-    grouper = itemgetter("page", "extraction_method")
-
-    for key, grp in groupby(sorted(templates, key=grouper), grouper):
-        tmp_options = [_convert_template_option(e) for e in grp]
+    # Bucket the entries in one pass. Only the bucket keys are sorted to keep
+    # the output in page order, and entries keep their order in each bucket.
+    groups: Dict[Tuple[Any, Any], List[TabulaOption]] = {}
+    for e in templates:
+        groups.setdefault((e["page"], e["extraction_method"]), []).append(
+            _convert_template_option(e)
+        )
 
+    for _, tmp_options in sorted(groups.items(), key=itemgetter(0)):
         if len(tmp_options) == 1:
             options.append(tmp_options[0])
             continue
 
-        option = tmp_options[0]
         _areas = [cast(Iterable[float], e.area) for e in tmp_options]
-        option.area = _areas
-        option.multiple_tables = True
-        options.append(option)
+        options.append(replace(tmp_options[0], area=_areas, multiple_tables=True))
 
     return options
 
@@ -4,6 +4,7 @@ Utility module providing some convenient functions.
 
 from __future__ import annotations
 
+import functools
 import os
 import platform
 import shlex
@@ -16,9 +17,13 @@ logger = getLogger(__name__)
 FileLikeObj = Union[IO, str, os.PathLike]
 
 
+@functools.lru_cache(maxsize=1)
 def java_version() -> str:
     """Show Java version
 
+    The result is cached for the process. Use ``java_version.cache_clear()``
+    to look it up again, e.g. after changing ``PATH``.
+
     Returns:
         str: Result of ``java -version``
     """
@@ -67,7 +72,7 @@ mac_ver: {platform.mac_ver()}"""
     )
 
 
-@dataclass
+@dataclass(frozen=True)
 class TabulaOption:
     """Build options for tabula-java
 
@@ -201,9 +206,10 @@ class TabulaOption:
             )
 
         multiple_areas = False
+        guess = self.guess
 
         if self.area:
-            self.guess = False
+            guess = False
             if type(self.area) in [list, tuple]:
                 # Check if nested list or tuple for multiple areas
                 if any(type(e) in [list, tuple] for e in self.area):
@@ -226,7 +232,7 @@ class TabulaOption:
         if self.stream:
             __options.append("--stream")
 
-        if self.guess and not multiple_areas:
+        if guess and not multiple_areas:
             __options.append("--guess")
 
         if self.format:
@@ -1,10 +1,12 @@
 import filecmp
+import importlib.util
 import json
 import os
 import shutil
 import tempfile
 import unittest
 import uuid
+from unittest.mock import patch
 
 import pandas as pd  # type: ignore
 
@@ -45,6 +47,26 @@ class TestReadPdfTable(unittest.TestCase):
         tabula.read_pdf(self.pdf_path, stream=True, encoding="cp932")
         self.assertTrue(tabula.io._tabula_vm.encoding, "cp932")
 
+    def test_read_pdf_with_workers(self):
+        expected = tabula.read_pdf(self.pdf_path, pages="1-3", force_subprocess=True)
+        dfs = tabula.read_pdf(
+            self.pdf_path, pages="1-3", force_subprocess=True, workers=2
+        )
+        self.assertEqual(len(dfs), len(expected))
+        for df, expected_df in zip(dfs, expected):
+            self.assertTrue(df.equals(expected_df))
+
+    def test_read_pdf_with_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        with patch("tabula.io.OUTPUT_CACHE_DIR", cache_dir):
+            expected = tabula.read_pdf(self.pdf_path, stream=True, cache=True)
+            with patch("tabula.io._run") as mock_run:
+                dfs = tabula.read_pdf(self.pdf_path, stream=True, cache=True)
+            mock_run.assert_not_called()
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+        self.assertTrue(dfs[0].equals(expected[0]))
+
     def test_read_pdf_into_json(self):
         expected_json = "tests/resources/data_1.json"
         json_data = tabula.read_pdf(
@@ -262,6 +284,38 @@ class TestReadPdfTable(unittest.TestCase):
         with self.assertRaises(ValueError):
             tabula.convert_into_by_batch(None, output_format="csv")
 
+    def test_convert_into_by_batch_with_workers(self):
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        for name in ("data1", "data2"):
+            shutil.copyfile(self.pdf_path, f"{temp_dir}/{name}.pdf")
+
+        tabula.convert_into_by_batch(
+            temp_dir,
+            output_format="csv",
+            stream=True,
+            force_subprocess=True,
+            workers=2,
+        )
+        for name in ("data1", "data2"):
+            self.assertTrue(filecmp.cmp(f"{temp_dir}/{name}.csv", self.expected_csv1))
+
+    @unittest.skipUnless(importlib.util.find_spec("jpype"), "jpype is not installed")
+    def test_convert_into_by_batch_with_workers_jpype(self):
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        for name in ("data1", "data2"):
+            shutil.copyfile(self.pdf_path, f"{temp_dir}/{name}.pdf")
+
+        # Earlier force_subprocess=True calls pin the subprocess backend
+        with patch("tabula.io._tabula_vm", None):
+            tabula.convert_into_by_batch(
+                temp_dir, output_format="csv", stream=True, workers=2
+            )
+            self.assertIsInstance(tabula.io._tabula_vm, tabula.backend.TabulaVm)
+        for name in ("data1", "data2"):
+            self.assertTrue(filecmp.cmp(f"{temp_dir}/{name}.csv", self.expected_csv1))
+
     def test_convert_remote_file(self):
         with tempfile.TemporaryDirectory() as tempdir:
             temp = os.path.join(tempdir, str(uuid.uuid4()))
@@ -283,6 +337,16 @@ class TestReadPdfTable(unittest.TestCase):
         self.assertEqual(len(dfs), 4)
         self.assertTrue(dfs[0].equals(pd.read_csv(self.expected_csv1)))
 
+    def test_read_pdf_with_template_with_workers(self):
+        template_path = "tests/resources/data.tabula-template.json"
+
+        expected = tabula.read_pdf_with_template(self.pdf_path, template_path)
+        with open(self.pdf_path, "rb") as pdf:
+            dfs = tabula.read_pdf_with_template(pdf, template_path, workers=2)
+        self.assertEqual(len(dfs), len(expected))
+        for df, expected_df in zip(dfs, expected):
+            self.assertTrue(df.equals(expected_df))
+
     def test_read_pdf_with_remote_template(self):
         template_path = (
             "https://github.com/chezou/tabula-py/raw/master/"
@@ -302,6 +366,14 @@ class TestReadPdfTable(unittest.TestCase):
         self.assertEqual(len(dfs), 4)
         self.assertTrue(dfs[0].equals(pd.read_csv(self.expected_csv1)))
 
+    def test_read_pdf_with_converters(self):
+        converters = {"cyl": str}
+        df = tabula.read_pdf(
+            self.pdf_path, stream=True, pandas_options={"converters": converters}
+        )[0]
+        expected = pd.read_csv(self.expected_csv1, converters=converters)
+        self.assertTrue(df.equals(expected))
+
     def test_read_pdf_with_dtype_string(self):
         pdf_path = "tests/resources/data_dtype.pdf"
         expected_csv = "tests/resources/data_dtype_expected.csv"
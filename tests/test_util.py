@@ -1,6 +1,11 @@
+import gzip
+import io
 import os
+import shutil
+import tempfile
 import unittest
-from unittest.mock import MagicMock, patch
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
 import tabula
 
@@ -12,31 +17,21 @@ class TestUtil(unittest.TestCase):
     def test_environment_info(self):
         self.assertEqual(tabula.environment_info(), None)
 
-    @patch("tabula.file_util.shutil.copyfileobj")
-    @patch("tabula.file_util.urlopen")
-    @patch("tabula.file_util._create_request")
-    def test_localize_file_with_user_agent(
-        self, mock_fun, mock_urlopen, mock_copyfileobj
-    ):
+    @patch("tabula.file_util._open_url")
+    def test_localize_file_with_user_agent(self, mock_open_url):
         uri = (
             "https://github.com/tabulapdf/tabula-java/raw/"
             "master/src/test/resources/technology/tabula/12s0324.pdf"
         )
         user_agent = "Mozilla/5.0"
-
-        cm = MagicMock()
-        cm.getcode.return_value = 200
-        cm.read.return_value = b"contents"
-        cm.geturl.return_value = uri
-        mock_urlopen.return_value = cm
+        _mock_response(mock_open_url, uri)
 
         fname, _ = tabula.file_util.localize_file(uri, user_agent=user_agent)
-        mock_fun.assert_called_with(uri, user_agent)
+        mock_open_url.assert_called_with(uri, user_agent)
         self.addCleanup(os.remove, fname)
 
-    @patch("tabula.file_util.shutil.copyfileobj")
-    @patch("tabula.file_util.urlopen")
-    def test_localize_file_with_non_ascii_url(self, mock_urlopen, mock_copyfileobj):
+    @patch("tabula.file_util._open_url")
+    def test_localize_file_with_non_ascii_url(self, mock_open_url):
         uri = (
             "https://github.com/tabulapdf/tabula-java/raw/"
             "master/src/test/resources/technology/tabula/日本語.pdf"
@@ -45,37 +40,195 @@ class TestUtil(unittest.TestCase):
             "https://github.com/tabulapdf/tabula-java/raw/master/src/test/"
             "resources/technology/tabula/%E6%97%A5%E6%9C%AC%E8%AA%9E.pdf"
         )
-
-        cm = MagicMock()
-        cm.getcode.return_value = 200
-        cm.read.return_value = b"contents"
-        cm.geturl.return_value = uri
-        mock_urlopen.return_value = cm
+        _mock_response(mock_open_url, uri)
 
         fname, _ = tabula.file_util.localize_file(uri)
-        mock_urlopen.assert_called_with(expected_uri)
+        mock_open_url.assert_called_with(expected_uri, None)
         self.addCleanup(os.remove, fname)
 
-    @patch("tabula.file_util.shutil.copyfileobj")
-    @patch("tabula.file_util.urlopen")
-    def test_localize_file_with_long_url(self, mock_urlopen, mock_copyfileobj):
+    @patch("tabula.file_util._open_url")
+    def test_localize_file_with_long_url(self, mock_open_url):
         uri = (
             "https://github.com/tabulapdf/tabula-py/raw/"
             "master/src/tests/resources/"
             "12345678901234567890123456789012345.pdf"
         )
-
-        cm = MagicMock()
-        cm.getcode.return_value = 200
-        cm.read.return_value = b"contents"
-        cm.geturl.return_value = uri
-        mock_urlopen.return_value = cm
+        _mock_response(mock_open_url, uri)
 
         fname, _ = tabula.file_util.localize_file(uri)
-        mock_urlopen.assert_called_with(uri)
+        mock_open_url.assert_called_with(uri, None)
         self.assertTrue(fname.endswith("123456789012345678901234567890.pdf"))
         self.addCleanup(os.remove, fname)
 
+    @patch("tabula.file_util._open_url")
+    def test_localize_files(self, mock_open_url):
+        uri = "https://github.com/chezou/tabula-py/raw/master/tests/resources/data.pdf"
+        pdf_path = "tests/resources/data.pdf"
+        _mock_response(mock_open_url, uri)
+
+        results = tabula.file_util.localize_files([uri, pdf_path, uri])
+        for fname, temporary in results:
+            if temporary:
+                self.addCleanup(os.remove, fname)
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[1], (pdf_path, False))
+        self.assertTrue(results[0][1])
+        self.assertTrue(results[2][1])
+        self.assertTrue(results[0][0].endswith("data.pdf"))
+        self.assertNotEqual(results[0][0], results[2][0])
+
+    @patch("tabula.file_util._open_url")
+    def test_localize_file_with_cache(self, mock_open_url):
+        uri = "https://github.com/chezou/tabula-py/raw/master/tests/resources/data.pdf"
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        _mock_response(mock_open_url, uri, headers={"ETag": '"abc"'})
+
+        with patch("tabula.file_util.CACHE_DIR", cache_dir):
+            fname, temporary = tabula.file_util.localize_file(uri, use_cache=True)
+            self.assertFalse(temporary)
+            self.assertEqual(os.path.dirname(fname), cache_dir)
+
+            _mock_response(mock_open_url, uri, status=304, body=b"")
+            self.assertEqual(
+                tabula.file_util.localize_file(uri, use_cache=True), (fname, False)
+            )
+            headers = mock_open_url.call_args[0][2]
+            self.assertEqual(headers["If-None-Match"], '"abc"')
+
+        with open(fname, "rb") as f:
+            self.assertEqual(f.read(), b"contents")
+
+    @unittest.skipIf(tabula.file_util.urllib3 is None, "urllib3 is not installed")
+    @patch("tabula.file_util._pool_manager")
+    def test_open_url_with_urllib3_1x_response(self, mock_pool_manager):
+        class Urllib3V1Response(io.BytesIO):
+            # urllib3 1.26 responses have geturl() but no url attribute
+            status = 200
+            reason = "OK"
+            headers = {"Content-Length": "8"}
+
+            def geturl(self):
+                return "/redirected.pdf"
+
+            def release_conn(self):
+                pass
+
+        mock_pool_manager.return_value.request.return_value = Urllib3V1Response(
+            b"contents"
+        )
+        with tabula.file_util._open_url("http://localhost/data.pdf", None) as resp:
+            self.assertEqual(resp.url, "http://localhost/redirected.pdf")
+            self.assertEqual(resp.content_length, "8")
+            self.assertEqual(resp.body.read(), b"contents")
+
+    def test_localize_file_with_wrapped_file(self):
+        pdf_path = "tests/resources/data.pdf"
+        with open(pdf_path, "rb") as f:
+            self.assertEqual(tabula.file_util.localize_file(f), (pdf_path, False))
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        gz_path = os.path.join(temp_dir, "data.pdf.gz")
+        with open(pdf_path, "rb") as src, gzip.open(gz_path, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+
+        # The gzip object is named after the compressed file, which must not
+        # be passed to tabula-java
+        with gzip.open(gz_path, "rb") as f:
+            fname, temporary = tabula.file_util.localize_file(f)
+        self.addCleanup(os.remove, fname)
+        self.assertTrue(temporary)
+        self.assertNotEqual(fname, gz_path)
+        with open(fname, "rb") as f, open(pdf_path, "rb") as expected:
+            self.assertEqual(f.read(), expected.read())
+
+    def test_is_file_like(self):
+        class Reader:
+            def __iter__(self):
+                return iter([])
+
+        self.assertFalse(tabula.file_util.is_file_like(Reader()))
+        reader = Reader()
+        reader.read = lambda size=-1: b""
+        self.assertTrue(tabula.file_util.is_file_like(reader))
+        self.assertFalse(tabula.file_util.is_file_like(Reader()))
+        self.assertTrue(tabula.file_util.is_file_like(io.BytesIO()))
+        self.assertFalse(tabula.file_util.is_file_like("data.pdf"))
+
+    def test_env_int(self):
+        with patch.dict(os.environ, {"TABULA_CACHE_MAX_SIZE": "2048"}):
+            self.assertEqual(
+                tabula.file_util._env_int("TABULA_CACHE_MAX_SIZE", 1024), 2048
+            )
+        for value in ("1G", "-1"):
+            with patch.dict(os.environ, {"TABULA_CACHE_MAX_SIZE": value}):
+                with self.assertLogs("tabula.file_util", "WARNING"):
+                    self.assertEqual(
+                        tabula.file_util._env_int("TABULA_CACHE_MAX_SIZE", 1024), 1024
+                    )
+
+    def test_evict_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        for mtime, name in enumerate(["old", "mid", "new"]):
+            for ext in (".pdf", ".json"):
+                path = os.path.join(cache_dir, name + ext)
+                with open(path, "wb") as f:
+                    f.write(b"x" * 10)
+                os.utime(path, (mtime, mtime))
+        open(os.path.join(cache_dir, "old.lock"), "wb").close()
+
+        tabula.file_util._evict_cache(cache_dir, 40, keep="new")
+        self.assertEqual(
+            sorted(os.listdir(cache_dir)),
+            ["mid.json", "mid.pdf", "new.json", "new.pdf", "old.lock"],
+        )
+
+        tabula.file_util._evict_cache(cache_dir, 0, keep="new")
+        self.assertEqual(
+            sorted(os.listdir(cache_dir)), ["new.json", "new.pdf", "old.lock"]
+        )
+
+    def test_write_output_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        cache_path = os.path.join(cache_dir, "key.txt")
+        with ThreadPoolExecutor(8) as executor:
+            list(
+                executor.map(
+                    lambda i: tabula.io._write_output_cache(cache_path, "output"),
+                    range(32),
+                )
+            )
+        self.assertEqual(os.listdir(cache_dir), ["key.txt"])
+
+        # A cache which can't be written is skipped with a warning
+        not_dir = os.path.join(cache_dir, "key.txt", "key.txt")
+        with self.assertLogs("tabula.io", "WARNING"):
+            tabula.io._write_output_cache(not_dir, "output")
+
+    @patch("tabula.io._tabula_vm", None)
+    @patch("tabula.io._init_tabula_vm", side_effect=RuntimeError("No JVM"))
+    @patch("tabula.io.localize_file")
+    def test_localize_input_with_jvm_failure(self, mock_localize_file, _):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(lambda: os.path.exists(path) and os.remove(path))
+        mock_localize_file.return_value = (path, True)
+
+        with self.assertRaises(RuntimeError):
+            tabula.io._localize_input(
+                "http://localhost/data.pdf", None, "utf-8", None, False
+            )
+        self.assertFalse(os.path.exists(path))
+
+    @patch.dict(os.environ, {"TABULA_JAR": "/tmp/not-existing-tabula-java.jar"})
+    def test_jar_path_not_found(self):
+        with self.assertRaises(FileNotFoundError):
+            tabula.backend.jar_path()
+
     def test_tabula_option_area_order(self):
         self.assertTrue(
             type(tabula.util.TabulaOption(area=[2, 3, 4, 6]).build_option_list()), list
@@ -101,5 +254,11 @@ class TestUtil(unittest.TestCase):
             tabula.util.TabulaOption(columns=[3, 4, 1]).build_option_list()
 
 
+def _mock_response(mock_open_url, uri, status=200, body=b"contents", headers=None):
+    mock_open_url.return_value.__enter__.side_effect = lambda: (
+        tabula.file_util._Response(uri, io.BytesIO(body), None, status, headers or {})
+    )
+
+
 if __name__ == "__main__":
     unittest.main()